@@ -0,0 +1 @@
+"""Surat event info assistant API package."""
@@ -0,0 +1,52 @@
+"""Application configuration loaded from environment variables."""
+
+import functools
+from typing import Annotated, Tuple
+
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Immutable runtime settings for the assistant service.
+
+    Values come from the environment (or a local ``.env``); parsing and
+    validation happen once in pydantic-core when the instance is built.
+    """
+
+    model_config = SettingsConfigDict(env_prefix="", env_file=".env", frozen=True)
+
+    app_title: str = "Surat Event Info Assistant"
+    app_version: str = "0.1.0"
+    openai_api_key: str = ""
+    openai_model: str = "gpt-4o-mini"
+    openai_temperature: float = 0.4
+    openai_max_tokens: int = 700
+    tavily_api_key: str = ""
+    search_results_limit: int = 5
+    search_timeout_seconds: float = 8.0
+    cors_allow_origins: Annotated[Tuple[str, ...], NoDecode] = ("*",)
+    log_level: str = "INFO"
+    debug: bool = False
+
+    @field_validator("cors_allow_origins", mode="before")
+    @classmethod
+    def _split_csv(cls, value):
+        if isinstance(value, str):
+            return tuple(item.strip() for item in value.split(",") if item.strip())
+        return value
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide ``Settings`` singleton.
+
+    The environment is read once; ``Settings`` is frozen, so the cached
+    instance is safe to share across requests.
+    """
+    return Settings()
+
+
+def reset_settings_cache() -> None:
+    """Clear the cached settings so the environment is re-read (tests)."""
+    get_settings.cache_clear()
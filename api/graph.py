@@ -0,0 +1,195 @@
+"""LangGraph reply pipeline: classify intent, search, synthesize."""
+
+import logging
+import re
+import types
+from typing import List, TypedDict
+
+from langgraph.graph import END, StateGraph
+
+from .config import get_settings
+from .llm import LLMNotConfiguredError, generate_email_reply
+from .search import Source, search_recent_surat_events
+
+logger = logging.getLogger(__name__)
+
+_REFUSAL_TEXT = (
+    "Thank you for writing in. I can only help with information about "
+    "events and happenings in Surat, and I am not able to assist with "
+    "this request.\n\n— Surat Event Info Assistant"
+)
+
+
+class ReplyState(TypedDict, total=False):
+    subject: str
+    body: str
+    intent: str
+    refused: bool
+    sources: List[Source]
+    search_backend: str
+    reply: str
+
+
+_UNSAFE_MARKERS = (
+    "how to make a bomb",
+    "buy drugs",
+    "child sexual",
+    "explicit sexual",
+    "kill",
+    "terrorist",
+)
+_UNSAFE_RE = re.compile("|".join(re.escape(m) for m in _UNSAFE_MARKERS))
+
+
+def _contains_unsafe_request(lowered: str) -> bool:
+    """Check a pre-lowercased body for unsafe markers."""
+    return _UNSAFE_RE.search(lowered) is not None
+
+
+# Keyword → intent table, compiled below into a single alternation so the
+# body is scanned once instead of once per keyword list.
+_INTENT_KEYWORDS = {
+    "concert": "music_events",
+    "music": "music_events",
+    "gig": "music_events",
+    "band": "music_events",
+    "dj night": "music_events",
+    "festival": "festivals",
+    "navratri": "festivals",
+    "garba": "festivals",
+    "diwali": "festivals",
+    "mela": "festivals",
+    "exhibition": "exhibitions",
+    "expo": "exhibitions",
+    "trade fair": "exhibitions",
+    "textile": "exhibitions",
+    "diamond": "exhibitions",
+    "cricket": "sports_events",
+    "marathon": "sports_events",
+    "sports": "sports_events",
+    "match": "sports_events",
+    "tournament": "sports_events",
+    "food": "food_events",
+    "street food": "food_events",
+    "culinary": "food_events",
+    "restaurant": "food_events",
+    "tasting": "food_events",
+}
+# Longer keywords first so e.g. "street food" wins over "food" at the
+# same position.
+_INTENT_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_INTENT_KEYWORDS, key=len, reverse=True))
+)
+
+
+def _basic_intent_classifier(lowered: str) -> str:
+    """Classify a pre-lowercased body by its earliest keyword hit."""
+    match = _INTENT_RE.search(lowered)
+    if match is None:
+        return "general_events"
+    return _INTENT_KEYWORDS[match.group(0)]
+
+
+_MULTINEWLINE_RE = re.compile(r"\n{3,}")
+
+
+def _strip_excess_whitespace(s: str) -> str:
+    return _MULTINEWLINE_RE.sub("\n\n", s).strip()
+
+
+def _fallback_reply(sources: List[Source]) -> str:
+    if not sources:
+        return (
+            "Thank you for reaching out. I could not find reliable "
+            "information about recent events in Surat right now. Please "
+            "try again later.\n\n— Surat Event Info Assistant"
+        )
+    lines = ["Thank you for reaching out. Here is what I found about events in Surat:", ""]
+    for source in sources:
+        lines.append(f"- {source.title}: {source.url}")
+    lines.append("")
+    lines.append("— Surat Event Info Assistant")
+    return "\n".join(lines)
+
+
+# The recency hint is baked into each query; search_recent_surat_events
+# uses the query as-is.
+_INTENT_QUERIES = types.MappingProxyType(
+    {
+        "music_events": "upcoming music concerts and shows in Surat 2025 2024",
+        "festivals": "upcoming festivals and celebrations in Surat 2025 2024",
+        "exhibitions": "exhibitions expos and trade fairs in Surat 2025 2024",
+        "sports_events": "sports events and tournaments in Surat 2025 2024",
+        "food_events": "food events and festivals in Surat 2025 2024",
+        "general_events": "recent events in Surat 2025 2024",
+    }
+)
+# Query prefixes with the static joiner baked in, so building the final
+# query is a single concatenation per request.
+_INTENT_QUERY_PREFIXES = types.MappingProxyType(
+    {intent: f"{query}. User request: " for intent, query in _INTENT_QUERIES.items()}
+)
+_DEFAULT_QUERY_PREFIX = _INTENT_QUERY_PREFIXES["general_events"]
+
+
+async def node_search(state: ReplyState) -> ReplyState:
+    # Intent classification is a single regex pass, so it runs inline
+    # here as a preprocessor rather than as its own graph superstep.
+    body = state.get("body", "")
+    body_lower = body.lower()
+    if _contains_unsafe_request(body_lower):
+        return {"intent": "unsafe", "refused": True}
+    intent = _basic_intent_classifier(body_lower)
+    prefix = _INTENT_QUERY_PREFIXES.get(intent, _DEFAULT_QUERY_PREFIX)
+    augmented = prefix + body[:280]
+    sources, backend = await search_recent_surat_events(augmented)
+    return {
+        "intent": intent,
+        "refused": False,
+        "sources": sources,
+        "search_backend": backend,
+    }
+
+
+def node_refuse(state: ReplyState) -> ReplyState:
+    return {"reply": _REFUSAL_TEXT, "sources": [], "search_backend": "none"}
+
+
+async def node_synthesize(state: ReplyState) -> ReplyState:
+    settings = get_settings()
+    subject = state.get("subject", "")
+    body = state.get("body", "")
+    intent = state.get("intent", "general_events")
+    sources = state.get("sources", [])
+    try:
+        reply = await generate_email_reply(subject, body, intent, sources)
+    except LLMNotConfiguredError as exc:
+        logger.warning("LLM not configured: %s", exc)
+        reply = _fallback_reply(sources)
+    except Exception as exc:
+        logger.error("Reply generation failed: %s", exc)
+        if settings.debug:
+            raise
+        reply = _fallback_reply(sources)
+    return {"reply": _strip_excess_whitespace(reply)}
+
+
+def _route_after_classify(state: ReplyState) -> str:
+    return "refuse" if state.get("refused") else "synthesize"
+
+
+def build_reply_graph():
+    """Compile the search (with inline classification) → synthesize graph."""
+    graph = StateGraph(ReplyState)
+    graph.add_node("search", node_search)
+    graph.add_node("refuse", node_refuse)
+    graph.add_node("synthesize", node_synthesize)
+    graph.set_entry_point("search")
+    graph.add_conditional_edges(
+        "search",
+        _route_after_classify,
+        {"refuse": "refuse", "synthesize": "synthesize"},
+    )
+    graph.add_edge("synthesize", END)
+    graph.add_edge("refuse", END)
+    return graph.compile()
@@ -0,0 +1,100 @@
+"""LLM-backed email reply generation."""
+
+import functools
+import logging
+from typing import AsyncIterator, Final, List
+
+from .config import get_settings
+from .search import Source
+
+logger = logging.getLogger(__name__)
+
+_RULES: Final = (
+    "Only discuss events and happenings in Surat, India.",
+    "Ground every claim in the provided sources; do not invent events.",
+    "If the sources are empty or irrelevant, say so politely.",
+    "Keep the tone warm, concise, and suitable for an email reply.",
+    "Close with a short sign-off from the Surat Event Info Assistant.",
+)
+_SYSTEM_PROMPT: Final[str] = (
+    "You are a helpful assistant that drafts email replies about recent "
+    "and upcoming events in Surat, India. Follow these rules strictly:\n"
+    + "\n".join(f"- {rule}" for rule in _RULES)
+)
+
+
+class LLMNotConfiguredError(RuntimeError):
+    """Raised when no OpenAI API key is configured."""
+
+
+@functools.lru_cache(maxsize=4)
+def _client(api_key: str):
+    """Return a shared async OpenAI client so its connection pool is reused."""
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI(api_key=api_key)
+
+
+def _format_sources_for_prompt(sources: List[Source]) -> str:
+    return "\n".join(
+        f"{index}. {source.title} — {source.url}"
+        for index, source in enumerate(sources, 1)
+    )
+
+
+def _build_user_prompt(
+    subject: str, body: str, intent: str, sources: List[Source]
+) -> str:
+    return (
+        f"Email subject: {subject or '(no subject)'}\n"
+        f"Email body:\n{body}\n\n"
+        f"Detected intent: {intent}\n"
+        f"Search sources:\n{_format_sources_for_prompt(sources) or '(none)'}\n\n"
+        "Draft the reply email body now."
+    )
+
+
+async def generate_email_reply(
+    subject: str, body: str, intent: str, sources: List[Source]
+) -> str:
+    """Draft an email reply about Surat events grounded in ``sources``."""
+    settings = get_settings()
+    if not settings.openai_api_key:
+        raise LLMNotConfiguredError("OPENAI_API_KEY is not set")
+
+    client = _client(settings.openai_api_key)
+    response = await client.chat.completions.create(
+        model=settings.openai_model,
+        messages=[
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": _build_user_prompt(subject, body, intent, sources)},
+        ],
+        temperature=settings.openai_temperature,
+        max_tokens=settings.openai_max_tokens,
+    )
+    return (response.choices[0].message.content or "").strip()
+
+
+async def stream_email_reply(
+    subject: str, body: str, intent: str, sources: List[Source]
+) -> AsyncIterator[str]:
+    """Yield reply tokens as they arrive from the model."""
+    settings = get_settings()
+    if not settings.openai_api_key:
+        raise LLMNotConfiguredError("OPENAI_API_KEY is not set")
+
+    client = _client(settings.openai_api_key)
+    stream = await client.chat.completions.create(
+        model=settings.openai_model,
+        messages=[
+            {"role": "system", "content": _SYSTEM_PROMPT},
+            {"role": "user", "content": _build_user_prompt(subject, body, intent, sources)},
+        ],
+        temperature=settings.openai_temperature,
+        max_tokens=settings.openai_max_tokens,
+        stream=True,
+    )
+    async for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            yield delta
@@ -0,0 +1,158 @@
+"""FastAPI entrypoint for the Surat event info assistant."""
+
+import logging
+import os
+import time
+import uuid
+from typing import List
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+import orjson
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+
+from .config import get_settings
+from .graph import _REFUSAL_TEXT, _fallback_reply, build_reply_graph, node_search
+from .llm import LLMNotConfiguredError, stream_email_reply
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+logging.basicConfig(level=settings.log_level)
+
+app = FastAPI(
+    title=settings.app_title,
+    version=settings.app_version,
+    default_response_class=ORJSONResponse,
+)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=list(settings.cors_allow_origins),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+_reply_graph = build_reply_graph()
+
+
+class ReplyRequest(BaseModel):
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
+    subject: str = Field(default="", max_length=500)
+    body: str = Field(min_length=1, max_length=20000)
+
+
+class SourceOut(BaseModel):
+    title: str
+    url: str
+    snippet: str
+
+
+class ReplyResponse(BaseModel):
+    reply: str
+    intent: str
+    sources: List[SourceOut]
+    search_backend: str
+
+
+@app.middleware("http")
+async def add_request_id_and_timing(request: Request, call_next):
+    request_id = uuid.uuid4().hex
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed_ms = (time.perf_counter() - start) * 1000.0
+    response.headers["X-Request-ID"] = request_id
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "request_completed",
+            extra={
+                "request_id": request_id,
+                "method": request.method,
+                "path": request.url.path,
+                "status_code": response.status_code,
+                "elapsed_ms": round(elapsed_ms, 2),
+            },
+        )
+    return response
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+
+@app.post("/reply", response_model=ReplyResponse)
+async def create_reply(payload: ReplyRequest) -> ReplyResponse:
+    state = {"subject": payload.subject, "body": payload.body}
+    result = await _reply_graph.ainvoke(state)
+    return ReplyResponse(
+        reply=result["reply"],
+        intent=result.get("intent", "general_events"),
+        sources=[
+            SourceOut(title=s.title, url=s.url, snippet=s.snippet)
+            for s in result.get("sources", [])
+        ],
+        search_backend=result.get("search_backend", "none"),
+    )
+
+
+def _sse_event(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+@app.post("/reply/stream")
+async def create_reply_stream(payload: ReplyRequest) -> StreamingResponse:
+    """Stream the reply as SSE token events, ending with a sources event."""
+    state = {"subject": payload.subject, "body": payload.body}
+    result = await node_search(state)
+    intent = result.get("intent", "general_events")
+    sources = result.get("sources", [])
+
+    async def event_stream():
+        if result.get("refused"):
+            yield _sse_event("token", {"text": _REFUSAL_TEXT})
+        else:
+            emitted = False
+            try:
+                async for token in stream_email_reply(
+                    payload.subject, payload.body, intent, sources
+                ):
+                    emitted = True
+                    yield _sse_event("token", {"text": token})
+            except LLMNotConfiguredError as exc:
+                logger.warning("LLM not configured: %s", exc)
+                yield _sse_event("token", {"text": _fallback_reply(sources)})
+            except Exception as exc:
+                logger.error("Reply streaming failed: %s", exc)
+                if settings.debug:
+                    raise
+                if not emitted:
+                    yield _sse_event("token", {"text": _fallback_reply(sources)})
+        yield _sse_event(
+            "sources",
+            {
+                "intent": intent,
+                "search_backend": result.get("search_backend", "none"),
+                "sources": [
+                    {"title": s.title, "url": s.url, "snippet": s.snippet}
+                    for s in sources
+                ],
+            },
+        )
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "api.main:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count(),
+    )
@@ -0,0 +1,138 @@
+"""Web search helpers for recent events in Surat.
+
+Tavily is the primary backend when an API key is configured; DuckDuckGo
+is used as a keyless fallback.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from cachetools import TTLCache
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Repeated queries within the TTL are served from memory instead of
+# re-hitting the search backends. Guarded by a lock because FastAPI may
+# still touch this module from threadpool threads.
+_SEARCH_CACHE: TTLCache = TTLCache(maxsize=256, ttl=600)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Source:
+    """A single search result backing a generated reply."""
+
+    title: str
+    url: str
+    snippet: str
+
+
+def _dedupe_sources(sources: List[Source], limit: int) -> List[Source]:
+    seen = {}
+    for source in sources:
+        key = source.url.strip().lower()
+        if key and key not in seen:
+            seen[key] = source
+            if len(seen) >= limit:
+                break
+    return list(seen.values())
+
+
+@functools.lru_cache(maxsize=2)
+def _tavily(api_key: str):
+    """Return a shared Tavily client so its HTTP session is reused."""
+    from tavily import AsyncTavilyClient
+
+    return AsyncTavilyClient(api_key=api_key)
+
+
+async def _search_with_tavily(query: str, limit: int) -> List[Source]:
+    settings = get_settings()
+    client = _tavily(settings.tavily_api_key)
+    response = await client.search(query=query, max_results=limit, search_depth="basic")
+    return [
+        Source(
+            title=result.get("title", "") or "Untitled",
+            url=result.get("url", "") or "",
+            snippet=result.get("content", "") or "",
+        )
+        for result in response.get("results", [])
+    ]
+
+
+_DDGS = None
+_DDGS_LOCK = threading.Lock()
+
+
+def _ddgs():
+    """Return a shared DDGS instance so its HTTP session is reused."""
+    global _DDGS
+    if _DDGS is None:
+        with _DDGS_LOCK:
+            if _DDGS is None:
+                from duckduckgo_search import DDGS
+
+                _DDGS = DDGS()
+    return _DDGS
+
+
+def _search_with_duckduckgo(query: str, limit: int) -> List[Source]:
+    results = list(_ddgs().text(query, max_results=limit))
+    return [
+        Source(
+            title=result.get("title", "") or "Untitled",
+            url=result.get("href", "") or "",
+            snippet=result.get("body", "") or "",
+        )
+        for result in results
+    ]
+
+
+async def search_recent_surat_events(
+    query: str, limit: Optional[int] = None
+) -> Tuple[List[Source], str]:
+    """Search the web for recent Surat events matching ``query``.
+
+    The query is sent to the backends as-is; callers are expected to
+    include any recency or locality hints (see graph._INTENT_QUERIES).
+    Returns the deduplicated sources and the name of the backend that
+    produced them ("tavily", "duckduckgo", or "none").
+    """
+    settings = get_settings()
+    if limit is None:
+        limit = settings.search_results_limit
+    cache_key = (query.lower(), limit)
+    with _SEARCH_CACHE_LOCK:
+        cached = _SEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    sources: List[Source] = []
+    backend = "none"
+    if settings.tavily_api_key:
+        try:
+            sources = await _search_with_tavily(query, limit)
+            backend = "tavily"
+        except Exception as exc:
+            logger.warning("Tavily search failed: %s", exc)
+    if not sources:
+        try:
+            # duckduckgo_search only offers a sync client; keep the
+            # fallback off the event loop.
+            sources = await asyncio.to_thread(
+                _search_with_duckduckgo, query, limit
+            )
+            backend = "duckduckgo"
+        except Exception as exc:
+            logger.warning("DuckDuckGo search failed: %s", exc)
+            backend = "none"
+    result = (_dedupe_sources(sources, limit), backend)
+    if backend != "none":
+        with _SEARCH_CACHE_LOCK:
+            _SEARCH_CACHE[cache_key] = result
+    return result